@@ -0,0 +1,273 @@
+/*
+ * Native TEA (Tiny Encryption Algorithm) round kernels.
+ *
+ * Loaded through ctypes by _tea_kernels.py when a shared library built from this file sits next to it:
+ *
+ *     cc -O3 -shared -fPIC -o _tea_core.so _tea_core.c
+ *
+ * The round keys k0..k3 are the first four bytes of the 16-byte TEA key (one byte per round key), matching the
+ * pure-Python implementation in tea.py. tea_encrypt/tea_decrypt process a single block and return it as
+ * (v0 << 32) | v1; tea_encrypt_blocks encrypts a buffer of big-endian blocks in place, and tea_decrypt_blocks
+ * decrypts one into a separate output buffer, optionally XOR-ing each block with the preceding ciphertext block (CBC).
+ * On x86 CPUs with AVX2 (detected at run time) the buffer kernels process 8 blocks at a time, one per 32-bit vector
+ * lane.
+ *
+ * None of the kernels touch Python objects. ctypes releases the GIL around every call into a CDLL, so threads
+ * can run the bulk kernels on separate buffers in parallel.
+ */
+#include <stddef.h>
+#include <stdint.h>
+#include <string.h>
+
+#define TEA_DELTA 0x9e3779b9u
+#define TEA_DECRYPT_SUM 0xC6EF3720u
+
+#if defined(__GNUC__) && !defined(__clang__) && __GNUC__ >= 8
+#define TEA_UNROLL _Pragma("GCC unroll 32")
+#else
+#define TEA_UNROLL
+#endif
+
+static inline void tea_encrypt_words(uint32_t *v0p, uint32_t *v1p, const uint32_t k[4])
+{
+    uint32_t v0 = *v0p, v1 = *v1p, s = 0;
+
+    TEA_UNROLL
+    for (int i = 0; i < 32; i++) {
+        s += TEA_DELTA;
+        v0 += ((v1 << 4) + k[0]) ^ (v1 + s) ^ ((v1 >> 5) + k[1]);
+        v1 += ((v0 << 4) + k[2]) ^ (v0 + s) ^ ((v0 >> 5) + k[3]);
+    }
+    *v0p = v0;
+    *v1p = v1;
+}
+
+static inline void tea_decrypt_words(uint32_t *v0p, uint32_t *v1p, const uint32_t k[4])
+{
+    uint32_t v0 = *v0p, v1 = *v1p, s = TEA_DECRYPT_SUM;
+
+    TEA_UNROLL
+    for (int i = 0; i < 32; i++) {
+        v1 -= ((v0 << 4) + k[2]) ^ (v0 + s) ^ ((v0 >> 5) + k[3]);
+        v0 -= ((v1 << 4) + k[0]) ^ (v1 + s) ^ ((v1 >> 5) + k[1]);
+        s -= TEA_DELTA;
+    }
+    *v0p = v0;
+    *v1p = v1;
+}
+
+uint64_t tea_encrypt(uint32_t v0, uint32_t v1, uint32_t k0, uint32_t k1, uint32_t k2, uint32_t k3)
+{
+    const uint32_t k[4] = {k0, k1, k2, k3};
+
+    tea_encrypt_words(&v0, &v1, k);
+    return ((uint64_t)v0 << 32) | v1;
+}
+
+uint64_t tea_decrypt(uint32_t v0, uint32_t v1, uint32_t k0, uint32_t k1, uint32_t k2, uint32_t k3)
+{
+    const uint32_t k[4] = {k0, k1, k2, k3};
+
+    tea_decrypt_words(&v0, &v1, k);
+    return ((uint64_t)v0 << 32) | v1;
+}
+
+static inline uint32_t load_be32(const uint8_t *p)
+{
+    return ((uint32_t)p[0] << 24) | ((uint32_t)p[1] << 16) | ((uint32_t)p[2] << 8) | (uint32_t)p[3];
+}
+
+static inline void store_be32(uint8_t *p, uint32_t v)
+{
+    p[0] = (uint8_t)(v >> 24);
+    p[1] = (uint8_t)(v >> 16);
+    p[2] = (uint8_t)(v >> 8);
+    p[3] = (uint8_t)v;
+}
+
+#if (defined(__x86_64__) || defined(__i386__)) && defined(__GNUC__)
+#define TEA_HAVE_AVX2_KERNEL 1
+#include <immintrin.h>
+
+/*
+ * Whether the CPU supports AVX2. Detected once when the library is loaded, before any thread can call into it, so
+ * the kernels only ever read it.
+ */
+static int tea_avx2;
+
+__attribute__((constructor))
+static void tea_detect_avx2(void)
+{
+    __builtin_cpu_init();
+    tea_avx2 = __builtin_cpu_supports("avx2") ? 1 : 0;
+}
+
+static inline int tea_cpu_has_avx2(void)
+{
+    return tea_avx2;
+}
+
+/*
+ * Load 8 consecutive big-endian blocks (64 bytes) and split them into one vector of v0 halves and one of v1 halves,
+ * so that each 32-bit lane holds one block.
+ */
+__attribute__((target("avx2")))
+static inline void tea_load_8x(const uint8_t *p, __m256i *v0, __m256i *v1)
+{
+    const __m256i bswap = _mm256_setr_epi8(3, 2, 1, 0, 7, 6, 5, 4, 11, 10, 9, 8, 15, 14, 13, 12,
+                                           3, 2, 1, 0, 7, 6, 5, 4, 11, 10, 9, 8, 15, 14, 13, 12);
+    const __m256i split = _mm256_setr_epi32(0, 2, 4, 6, 1, 3, 5, 7);
+    __m256i a = _mm256_shuffle_epi8(_mm256_loadu_si256((const __m256i *)p), bswap);
+    __m256i b = _mm256_shuffle_epi8(_mm256_loadu_si256((const __m256i *)(p + 32)), bswap);
+
+    /* a = [v0 of blocks 0-3 | v1 of blocks 0-3], b = the same for blocks 4-7 */
+    a = _mm256_permutevar8x32_epi32(a, split);
+    b = _mm256_permutevar8x32_epi32(b, split);
+    *v0 = _mm256_permute2x128_si256(a, b, 0x20);
+    *v1 = _mm256_permute2x128_si256(a, b, 0x31);
+}
+
+/* The inverse of tea_load_8x. */
+__attribute__((target("avx2")))
+static inline void tea_store_8x(uint8_t *p, __m256i v0, __m256i v1)
+{
+    const __m256i bswap = _mm256_setr_epi8(3, 2, 1, 0, 7, 6, 5, 4, 11, 10, 9, 8, 15, 14, 13, 12,
+                                           3, 2, 1, 0, 7, 6, 5, 4, 11, 10, 9, 8, 15, 14, 13, 12);
+    const __m256i merge = _mm256_setr_epi32(0, 4, 1, 5, 2, 6, 3, 7);
+    __m256i a = _mm256_permutevar8x32_epi32(_mm256_permute2x128_si256(v0, v1, 0x20), merge);
+    __m256i b = _mm256_permutevar8x32_epi32(_mm256_permute2x128_si256(v0, v1, 0x31), merge);
+
+    _mm256_storeu_si256((__m256i *)p, _mm256_shuffle_epi8(a, bswap));
+    _mm256_storeu_si256((__m256i *)(p + 32), _mm256_shuffle_epi8(b, bswap));
+}
+
+/* Encrypt the first nblocks / 8 * 8 blocks of buf in place, 8 blocks per iteration; returns the number processed. */
+__attribute__((target("avx2")))
+static size_t tea_encrypt_blocks_8x(uint8_t *buf, size_t nblocks, const uint32_t k[4])
+{
+    const __m256i delta = _mm256_set1_epi32((int)TEA_DELTA);
+    const __m256i k0 = _mm256_set1_epi32((int)k[0]), k1 = _mm256_set1_epi32((int)k[1]);
+    const __m256i k2 = _mm256_set1_epi32((int)k[2]), k3 = _mm256_set1_epi32((int)k[3]);
+    size_t i;
+
+    for (i = 0; i + 8 <= nblocks; i += 8, buf += 64) {
+        __m256i v0, v1, s = _mm256_setzero_si256();
+
+        tea_load_8x(buf, &v0, &v1);
+        for (int r = 0; r < 32; r++) {
+            s = _mm256_add_epi32(s, delta);
+            v0 = _mm256_add_epi32(v0, _mm256_xor_si256(
+                _mm256_xor_si256(_mm256_add_epi32(_mm256_slli_epi32(v1, 4), k0), _mm256_add_epi32(v1, s)),
+                _mm256_add_epi32(_mm256_srli_epi32(v1, 5), k1)));
+            v1 = _mm256_add_epi32(v1, _mm256_xor_si256(
+                _mm256_xor_si256(_mm256_add_epi32(_mm256_slli_epi32(v0, 4), k2), _mm256_add_epi32(v0, s)),
+                _mm256_add_epi32(_mm256_srli_epi32(v0, 5), k3)));
+        }
+        tea_store_8x(buf, v0, v1);
+    }
+    return i;
+}
+
+/*
+ * Decrypt the first nblocks / 8 * 8 blocks of in into out, 8 blocks per iteration; returns the number processed.
+ * If iv is not NULL, each block is XORed with the preceding block of in, and the first one with iv (CBC).
+ */
+__attribute__((target("avx2")))
+static size_t tea_decrypt_blocks_8x(const uint8_t *in, uint8_t *out, size_t nblocks, const uint8_t *iv,
+                                    const uint32_t k[4])
+{
+    const __m256i delta = _mm256_set1_epi32((int)TEA_DELTA);
+    const __m256i k0 = _mm256_set1_epi32((int)k[0]), k1 = _mm256_set1_epi32((int)k[1]);
+    const __m256i k2 = _mm256_set1_epi32((int)k[2]), k3 = _mm256_set1_epi32((int)k[3]);
+    size_t i;
+
+    for (i = 0; i + 8 <= nblocks; i += 8, in += 64, out += 64) {
+        __m256i v0, v1, s = _mm256_set1_epi32((int)TEA_DECRYPT_SUM);
+
+        tea_load_8x(in, &v0, &v1);
+        for (int r = 0; r < 32; r++) {
+            v1 = _mm256_sub_epi32(v1, _mm256_xor_si256(
+                _mm256_xor_si256(_mm256_add_epi32(_mm256_slli_epi32(v0, 4), k2), _mm256_add_epi32(v0, s)),
+                _mm256_add_epi32(_mm256_srli_epi32(v0, 5), k3)));
+            v0 = _mm256_sub_epi32(v0, _mm256_xor_si256(
+                _mm256_xor_si256(_mm256_add_epi32(_mm256_slli_epi32(v1, 4), k0), _mm256_add_epi32(v1, s)),
+                _mm256_add_epi32(_mm256_srli_epi32(v1, 5), k1)));
+            s = _mm256_sub_epi32(s, delta);
+        }
+        if (iv != NULL) {
+            __m256i c0, c1;
+
+            if (i == 0) {
+                /* The blocks preceding the first tile are the IV and the first 7 ciphertext blocks */
+                uint8_t chain[64];
+
+                memcpy(chain, iv, 8);
+                memcpy(chain + 8, in, 56);
+                tea_load_8x(chain, &c0, &c1);
+            } else {
+                tea_load_8x(in - 8, &c0, &c1);
+            }
+            v0 = _mm256_xor_si256(v0, c0);
+            v1 = _mm256_xor_si256(v1, c1);
+        }
+        tea_store_8x(out, v0, v1);
+    }
+    return i;
+}
+#endif
+
+void tea_encrypt_blocks(uint8_t *buf, size_t nblocks, uint32_t k0, uint32_t k1, uint32_t k2, uint32_t k3)
+{
+    const uint32_t k[4] = {k0, k1, k2, k3};
+
+#ifdef TEA_HAVE_AVX2_KERNEL
+    if (tea_cpu_has_avx2()) {
+        size_t done = tea_encrypt_blocks_8x(buf, nblocks, k);
+
+        buf += done * 8;
+        nblocks -= done;
+    }
+#endif
+    for (size_t i = 0; i < nblocks; i++, buf += 8) {
+        uint32_t v0 = load_be32(buf), v1 = load_be32(buf + 4);
+
+        tea_encrypt_words(&v0, &v1, k);
+        store_be32(buf, v0);
+        store_be32(buf + 4, v1);
+    }
+}
+
+/*
+ * Decrypt nblocks blocks of in into out. If iv is not NULL, each decrypted block is XORed with the preceding
+ * ciphertext block, and the first one with the 8-byte iv, which turns this into CBC decryption; in that case in and
+ * out must not overlap.
+ */
+void tea_decrypt_blocks(const uint8_t *in, uint8_t *out, size_t nblocks, const uint8_t *iv,
+                        uint32_t k0, uint32_t k1, uint32_t k2, uint32_t k3)
+{
+    const uint32_t k[4] = {k0, k1, k2, k3};
+
+#ifdef TEA_HAVE_AVX2_KERNEL
+    if (tea_cpu_has_avx2()) {
+        size_t done = tea_decrypt_blocks_8x(in, out, nblocks, iv, k);
+
+        if (done > 0 && iv != NULL)
+            iv = in + done * 8 - 8;
+        in += done * 8;
+        out += done * 8;
+        nblocks -= done;
+    }
+#endif
+    for (size_t i = 0; i < nblocks; i++, in += 8, out += 8) {
+        uint32_t v0 = load_be32(in), v1 = load_be32(in + 4);
+
+        tea_decrypt_words(&v0, &v1, k);
+        if (iv != NULL) {
+            v0 ^= load_be32(iv);
+            v1 ^= load_be32(iv + 4);
+            iv = in;
+        }
+        store_be32(out, v0);
+        store_be32(out + 4, v1);
+    }
+}
@@ -0,0 +1,42 @@
+# cython: language_level=3
+"""
+Cython TEA (Tiny Encryption Algorithm) round kernels.
+
+Imported by _tea_kernels.py when compiled in place, e.g. with:
+
+    cythonize -i _tea_cython.pyx
+
+The arithmetic runs on C uint32_t values, which wrap around on overflow, so the rounds need no masking. The round
+keys k0..k3 are the first four bytes of the TEA key, matching the pure-Python implementation in tea.py.
+"""
+cimport cython
+from libc.stdint cimport uint32_t
+
+cdef uint32_t DELTA = 0x9e3779b9
+cdef uint32_t DECRYPT_SUM = 0xC6EF3720
+
+
+@cython.boundscheck(False)
+@cython.cdivision(True)
+cpdef tuple tea_encrypt(uint32_t v0, uint32_t v1, uint32_t k0, uint32_t k1, uint32_t k2, uint32_t k3):
+    """Run the 32 TEA encryption rounds on the 32-bit halves `v0` and `v1` of a block."""
+    cdef uint32_t s = 0
+    cdef int i
+    for i in range(32):
+        s += DELTA
+        v0 += ((v1 << 4) + k0) ^ (v1 + s) ^ ((v1 >> 5) + k1)
+        v1 += ((v0 << 4) + k2) ^ (v0 + s) ^ ((v0 >> 5) + k3)
+    return v0, v1
+
+
+@cython.boundscheck(False)
+@cython.cdivision(True)
+cpdef tuple tea_decrypt(uint32_t v0, uint32_t v1, uint32_t k0, uint32_t k1, uint32_t k2, uint32_t k3):
+    """Run the 32 TEA decryption rounds on the 32-bit halves `v0` and `v1` of a block."""
+    cdef uint32_t s = DECRYPT_SUM
+    cdef int i
+    for i in range(32):
+        v1 -= ((v0 << 4) + k2) ^ (v0 + s) ^ ((v0 >> 5) + k3)
+        v0 -= ((v1 << 4) + k0) ^ (v1 + s) ^ ((v1 >> 5) + k1)
+        s -= DELTA
+    return v0, v1
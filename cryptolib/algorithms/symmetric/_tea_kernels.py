@@ -0,0 +1,110 @@
+"""
+Compiled TEA (Tiny Encryption Algorithm) round kernels.
+
+Three backends are tried for the single-block kernels, in order of preference:
+
+    - **Cython**: the `_tea_cython` extension module, if `_tea_cython.pyx` has been compiled in place.
+    - **C**: a shared library built from `_tea_core.c` next to this file, loaded with `ctypes`.
+    - **Numba**: the rounds below, compiled with `numba.njit` when Numba is installed.
+
+All are optional. If none is available, `tea_encrypt` and `tea_decrypt` are `None` and callers fall back to the
+pure-Python rounds. `tea_encrypt_blocks` and `tea_decrypt_blocks`, which process a whole buffer of blocks with the
+GIL released, are only provided by the C backend and are `None` otherwise.
+"""
+import ctypes
+import os
+import typing
+
+__all__ = ['tea_encrypt', 'tea_decrypt', 'tea_encrypt_blocks', 'tea_decrypt_blocks']
+
+tea_encrypt = None
+tea_decrypt = None
+tea_encrypt_blocks = None
+tea_decrypt_blocks = None
+
+
+def _load_core() -> typing.Optional[ctypes.CDLL]:
+    """Load the shared library built from `_tea_core.c`, if present."""
+    directory = os.path.dirname(os.path.abspath(__file__))
+    for suffix in ('.so', '.dylib', '.dll'):
+        path = os.path.join(directory, '_tea_core' + suffix)
+        if os.path.exists(path):
+            try:
+                return ctypes.CDLL(path)
+            except OSError:
+                return None
+    return None
+
+
+try:
+    from ._tea_cython import tea_encrypt, tea_decrypt
+except ImportError:  # The Cython module is optional and only present once compiled
+    pass
+
+_core = _load_core()
+
+if _core is not None:
+    _core.tea_encrypt.restype = _core.tea_decrypt.restype = ctypes.c_uint64
+    _core.tea_encrypt.argtypes = _core.tea_decrypt.argtypes = [ctypes.c_uint32] * 6
+
+    if tea_encrypt is None:
+        def tea_encrypt(v0, v1, k0, k1, k2, k3):
+            """Run the 32 TEA encryption rounds on the 32-bit halves `v0` and `v1` of a block."""
+            n = _core.tea_encrypt(v0, v1, k0, k1, k2, k3)
+            return n >> 32, n & 0xffffffff
+
+        def tea_decrypt(v0, v1, k0, k1, k2, k3):
+            """Run the 32 TEA decryption rounds on the 32-bit halves `v0` and `v1` of a block."""
+            n = _core.tea_decrypt(v0, v1, k0, k1, k2, k3)
+            return n >> 32, n & 0xffffffff
+
+    _core.tea_encrypt_blocks.restype = _core.tea_decrypt_blocks.restype = None
+    _core.tea_encrypt_blocks.argtypes = [ctypes.c_void_p, ctypes.c_size_t] + [ctypes.c_uint32] * 4
+    # The ciphertext and IV are passed as char pointers straight into the immutable bytes objects; None becomes NULL
+    _core.tea_decrypt_blocks.argtypes = [ctypes.c_char_p, ctypes.c_void_p, ctypes.c_size_t, ctypes.c_char_p]
+    _core.tea_decrypt_blocks.argtypes += [ctypes.c_uint32] * 4
+
+    def tea_encrypt_blocks(data, k0, k1, k2, k3):
+        """Encrypt every 64-bit big-endian block of `data` independently, without holding the GIL."""
+        buf = ctypes.create_string_buffer(data, len(data))
+        _core.tea_encrypt_blocks(buf, len(data) // 8, k0, k1, k2, k3)
+        return buf.raw
+
+    def tea_decrypt_blocks(data, k0, k1, k2, k3, iv=None):
+        """
+        Decrypt every 64-bit big-endian block of `data`, without holding the GIL. If an 8-byte `iv` is given, each
+        decrypted block is XORed with the preceding ciphertext block, and the first one with `iv` (CBC).
+        """
+        buf = ctypes.create_string_buffer(len(data))
+        _core.tea_decrypt_blocks(data, buf, len(data) // 8, iv, k0, k1, k2, k3)
+        return buf.raw
+
+if tea_encrypt is None:
+    try:
+        from numba import njit, types, uint32
+    except ImportError:  # Numba is optional
+        njit = None
+
+    if njit is not None:
+        _signature = types.UniTuple(uint32, 2)(uint32, uint32, uint32, uint32, uint32, uint32)
+
+        @njit(_signature, cache=True, fastmath=False)
+        def tea_encrypt(v0, v1, k0, k1, k2, k3):
+            """Run the 32 TEA encryption rounds on the 32-bit halves `v0` and `v1` of a block."""
+            # Numba widens integer arithmetic to 64 bits, so every assignment narrows back to uint32
+            s = uint32(0)
+            for _ in range(32):
+                s = uint32(s + uint32(0x9e3779b9))
+                v0 = uint32(v0 + (((v1 << 4) + k0) ^ (v1 + s) ^ ((v1 >> 5) + k1)))
+                v1 = uint32(v1 + (((v0 << 4) + k2) ^ (v0 + s) ^ ((v0 >> 5) + k3)))
+            return v0, v1
+
+        @njit(_signature, cache=True, fastmath=False)
+        def tea_decrypt(v0, v1, k0, k1, k2, k3):
+            """Run the 32 TEA decryption rounds on the 32-bit halves `v0` and `v1` of a block."""
+            s = uint32(0xC6EF3720)
+            for _ in range(32):
+                v1 = uint32(v1 - (((v0 << 4) + k2) ^ (v0 + s) ^ ((v0 >> 5) + k3)))
+                v0 = uint32(v0 - (((v1 << 4) + k0) ^ (v1 + s) ^ ((v1 >> 5) + k1)))
+                s = uint32(s - uint32(0x9e3779b9))
+            return v0, v1
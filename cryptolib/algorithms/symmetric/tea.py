@@ -1,7 +1,111 @@
+import concurrent.futures
+import functools
+import os
 import struct
 import typing
 from ... import modes
 from ...cipher import BlockCipherAlgorithm
+from . import _tea_kernels
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; the bulk paths fall back to pure Python
+    np = None
+
+# A 64-bit block as two big-endian 32-bit halves; a precompiled Struct beats int.from_bytes/to_bytes here
+_BLOCK = struct.Struct("!2I")
+
+# Messages of at least this many blocks are encrypted with NumPy when it is installed. Each NumPy round loop costs a
+# few hundred ufunc calls whatever the message size (about 0.3 ms), so shorter messages are faster in pure Python
+_NUMPY_MIN_BLOCKS = 512
+
+# Smallest share of a message, in bytes, worth handing to a separate thread in the parallel ECB methods; below it,
+# starting the thread pool costs more than the work it spreads out
+_PARALLEL_MIN_CHUNK = 8192
+
+
+def _xor8(a: bytes, b: bytes) -> bytes:
+    """XOR two 8-byte (64-bit) blocks as a single integer operation."""
+    return (int.from_bytes(a, 'big') ^ int.from_bytes(b, 'big')).to_bytes(8, 'big')
+
+
+def _xor_bytes_fallback(a: bytes, b: bytes) -> bytes:
+    """XOR two byte strings of equal length as two big integers."""
+    return (int.from_bytes(a, 'little') ^ int.from_bytes(b, 'little')).to_bytes(len(a), 'little')
+
+
+def _xor_bytes_numpy(a: bytes, b: bytes) -> bytes:
+    """XOR two byte strings of equal length as NumPy arrays."""
+    return np.bitwise_xor(np.frombuffer(a, dtype=np.uint8), np.frombuffer(b, dtype=np.uint8)).tobytes()
+
+
+# Messages of at least this many bytes are XORed with NumPy when it is installed; below it, the cost of wrapping the
+# inputs in arrays outweighs the faster XOR
+_NUMPY_MIN_XOR_BYTES = 512
+
+
+def _xor_bytes(a: bytes, b: bytes) -> bytes:
+    """XOR two byte strings of equal length, with NumPy for long ones when it is installed."""
+    if np is not None and len(a) >= _NUMPY_MIN_XOR_BYTES:
+        return _xor_bytes_numpy(a, b)
+    return _xor_bytes_fallback(a, b)
+
+
+def _encrypt_iv_with_keys(k: typing.Tuple[int, int, int, int], iv: bytes) -> bytes:
+    """Encrypt an 8-byte IV with the round keys `k`, without validating it."""
+    v0, v1 = _BLOCK.unpack(iv)
+    if _tea_kernels.tea_encrypt is not None:
+        v0, v1 = _tea_kernels.tea_encrypt(v0, v1, *k)
+    else:
+        v0, v1 = _tea_encrypt_unrolled(v0, v1, *k)
+    return _BLOCK.pack(v0, v1)
+
+
+# Mode pre-processing applied to a plaintext block before encryption
+def _pre_cbc(cipher: 'TEA', block: bytes, iv: bytes) -> bytes:
+    # CBC Mode: XOR the block with the IV before encryption
+    return _xor8(block, iv)
+
+
+def _pre_cfb_ofb(cipher: 'TEA', block: bytes, iv: bytes) -> bytes:
+    # CFB/OFB Mode: Encrypt the IV, XOR with plaintext to create ciphertext
+    # (the IV is already validated, so skip encrypt_iv's checks and use the cache directly)
+    return _xor8(block, cipher._enc_iv(iv))
+
+
+def _pre_ecb(cipher: 'TEA', block: bytes, iv: bytes) -> bytes:
+    return block
+
+
+# Mode post-processing applied to a decrypted block, given the ciphertext `block` it came from
+def _post_cbc(cipher: 'TEA', decrypted_block: bytes, block: bytes, iv: bytes) -> bytes:
+    # CBC Mode: XOR the decrypted block with the IV
+    return _xor8(decrypted_block, iv)
+
+
+def _post_cfb_ofb(cipher: 'TEA', decrypted_block: bytes, block: bytes, iv: bytes) -> bytes:
+    # CFB/OFB Mode: XOR the ciphertext block with the encrypted IV to recover plaintext
+    return _xor8(block, cipher._enc_iv(iv))
+
+
+def _post_ecb(cipher: 'TEA', decrypted_block: bytes, block: bytes, iv: bytes) -> bytes:
+    return decrypted_block
+
+
+_MODE_PREPROC = {modes.CBC: _pre_cbc, modes.CFB: _pre_cfb_ofb, modes.OFB: _pre_cfb_ofb, modes.ECB: _pre_ecb}
+_MODE_POSTPROC = {modes.CBC: _post_cbc, modes.CFB: _post_cfb_ofb, modes.OFB: _post_cfb_ofb, modes.ECB: _post_ecb}
+
+
+def _mode_handler(table: dict, mode: modes.Mode) -> typing.Callable:
+    """Look up the handler for `mode` in a dispatch table, keyed by the exact mode class."""
+    handler = table.get(type(mode))
+    if handler is None:
+        # Subclassed modes miss the exact-type lookup; resolve them through their base classes
+        for cls in type(mode).__mro__:
+            if cls in table:
+                return table[cls]
+        raise ValueError("Unsupported cipher mode.")
+    return handler
 
 
 class TEA(BlockCipherAlgorithm):
@@ -9,6 +113,10 @@ class TEA(BlockCipherAlgorithm):
     VERSION = '0.3.1'
     ROUNDS = 32
     DELTA = 0x9e3779b9  # Golden ratio constant
+    KEY_BYTES = 16  # key_size // 8
+    BLOCK_BYTES = 8  # block_size // 8
+    # Round sums (i + 1) * DELTA mod 2**32, precomputed so that no round carries the sum over from the previous one
+    SUMS = tuple(s & 0xffffffff for s in range(DELTA, DELTA * (ROUNDS + 1), DELTA))
 
     def __init__(self, key: bytes):
         """
@@ -18,9 +126,16 @@ class TEA(BlockCipherAlgorithm):
         """
         if not isinstance(key, bytes):
             raise TypeError(f"'key' must be of type 'bytes', not of type '{type(key).__name__}'.")
-        if len(key) != self.key_size // 8:
-            raise ValueError(f"TEA requires a {self.key_size}-bit ({self.key_size // 8}-byte) key.")
+        if len(key) != self.KEY_BYTES:
+            raise ValueError(f"TEA requires a {self.key_size}-bit ({self.KEY_BYTES}-byte) key.")
         self.key = key
+        # TEA uses the first four key bytes as its round keys; unpack them once for the round kernels
+        self._k = (key[0], key[1], key[2], key[3])
+        # Memo of the most recently encrypted IVs, so repeated CFB/OFB calls with the same IV skip the rounds. Like
+        # _encrypt_iv_raw, it does not validate the IV. It wraps a module-level function over the round keys rather
+        # than a bound method, so the cache holds no reference back to the instance; it lives as long as the instance
+        # and is emptied by clear_iv_cache().
+        self._enc_iv = functools.lru_cache(maxsize=64)(functools.partial(_encrypt_iv_with_keys, self._k))
 
     @property
     def key_size(self) -> int:
@@ -69,38 +184,12 @@ class TEA(BlockCipherAlgorithm):
         if not isinstance(iv, bytes):
             raise TypeError(f"'iv' must be of type 'bytes', not of type '{type(iv).__name__}'.")
 
-        if len(block) != self.block_size // 8:
-            raise ValueError(f"TEA operates on {self.block_size}-bit ({self.block_size // 8}-byte) blocks.")
-        if isinstance(mode, modes.IVMode) and (not iv or len(iv) != self.block_size // 8):
-            raise ValueError(f"The IV (Initialization Vector) must be {self.block_size}-bits ({self.block_size // 8}-bytes) long for IV-based modes.")
-
-        # Handle IV-based modes
-        if isinstance(mode, modes.CBC):
-            # CBC Mode: XOR the block with the IV before encryption
-            block = bytes(a ^ b for a, b in zip(block, iv))
-        elif isinstance(mode, (modes.CFB, modes.OFB)):
-            # CFB/OFB Mode: Encrypt the IV, XOR with plaintext to create ciphertext
-            encrypted_iv = self.encrypt_iv(iv)
-            block = bytes(a ^ b for a, b in zip(block, encrypted_iv))
-        elif isinstance(mode, modes.ECB):
-            pass
-        else:
-            raise ValueError("Unsupported cipher mode.")
-
-        # Convert the block to two 32-bit unsigned integers
-        v0, v1 = struct.unpack("!2I", block)
+        if len(block) != self.BLOCK_BYTES:
+            raise ValueError(f"TEA operates on {self.block_size}-bit ({self.BLOCK_BYTES}-byte) blocks.")
+        if isinstance(mode, modes.IVMode) and (not iv or len(iv) != self.BLOCK_BYTES):
+            raise ValueError(f"The IV (Initialization Vector) must be {self.block_size}-bits ({self.BLOCK_BYTES}-bytes) long for IV-based modes.")
 
-        # TEA encryption rounds
-        s = 0
-        for _ in range(self.ROUNDS):
-            s = (s + self.DELTA) & 0xffffffff
-            v0 += ((v1 << 4) + self.key[0] ^ (v1 + s) ^ (v1 >> 5) + self.key[1]) & 0xffffffff
-            v0 &= 0xffffffff
-            v1 += ((v0 << 4) + self.key[2] ^ (v0 + s) ^ (v0 >> 5) + self.key[3]) & 0xffffffff
-            v1 &= 0xffffffff
-
-        # Return the encrypted block as bytes
-        return struct.pack("!2I", v0, v1)
+        return self._encrypt_block_fast(block, _mode_handler(_MODE_PREPROC, mode), iv)
 
     def decrypt_block(self, block: bytes, mode: modes.Mode, iv: typing.Optional[bytes] = None) -> bytes:
         """
@@ -139,40 +228,318 @@ class TEA(BlockCipherAlgorithm):
         if not isinstance(iv, bytes):
             raise TypeError(f"'iv' must be of type 'bytes', not of type '{type(iv).__name__}'.")
 
-        if len(block) != self.block_size // 8:
-            raise ValueError(f"TEA operates on {self.block_size}-bit ({self.block_size // 8}-byte) blocks.")
-        if isinstance(mode, modes.IVMode) and (not iv or len(iv) != self.block_size // 8):
-            raise ValueError(f"The IV (Initialization Vector) must be {self.block_size}-bits ({self.block_size // 8}-bytes) long for IV-based modes.")
+        if len(block) != self.BLOCK_BYTES:
+            raise ValueError(f"TEA operates on {self.block_size}-bit ({self.BLOCK_BYTES}-byte) blocks.")
+        if isinstance(mode, modes.IVMode) and (not iv or len(iv) != self.BLOCK_BYTES):
+            raise ValueError(f"The IV (Initialization Vector) must be {self.block_size}-bits ({self.BLOCK_BYTES}-bytes) long for IV-based modes.")
+
+        return self._decrypt_block_fast(block, _mode_handler(_MODE_POSTPROC, mode), iv)
 
+    def _encrypt_block_fast(self, block: bytes, pre: typing.Callable, iv: typing.Optional[bytes]) -> bytes:
+        """Encrypt a block with the mode pre-processor `pre`, assuming the arguments are already validated."""
+        # Handle IV-based modes
+        block = pre(self, block, iv)
+
+        # Convert the block to two 32-bit unsigned integers
+        v0, v1 = _BLOCK.unpack(block)
+
+        # TEA encryption rounds
+        v0, v1 = self._encrypt_words(v0, v1)
+
+        # Return the encrypted block as bytes
+        return _BLOCK.pack(v0, v1)
+
+    def _decrypt_block_fast(self, block: bytes, post: typing.Callable, iv: typing.Optional[bytes]) -> bytes:
+        """Decrypt a block with the mode post-processor `post`, assuming the arguments are already validated."""
         # Convert the block to two 32-bit unsigned integers
-        v0, v1 = struct.unpack("!2I", block)
+        v0, v1 = _BLOCK.unpack(block)
 
         # TEA decryption rounds
-        s = 0xC6EF3720  # Initial value for decryption (opposite of encryption sum)
-        for _ in range(self.ROUNDS):
-            v1 -= ((v0 << 4) + self.key[2] ^ (v0 + s) ^ (v0 >> 5) + self.key[3]) & 0xffffffff
-            v1 &= 0xffffffff
-            v0 -= ((v1 << 4) + self.key[0] ^ (v1 + s) ^ (v1 >> 5) + self.key[1]) & 0xffffffff
-            v0 &= 0xffffffff
-            s = (s - self.DELTA) & 0xffffffff
+        v0, v1 = self._decrypt_words(v0, v1)
 
         # Reconstruct the decrypted block
-        decrypted_block = struct.pack("!2I", v0, v1)
+        decrypted_block = _BLOCK.pack(v0, v1)
 
         # Handle IV-based modes
+        return post(self, decrypted_block, block, iv)
+
+    def encrypt_blocks(self, data: bytes, mode: modes.Mode, iv: typing.Optional[bytes] = None) -> bytes:
+        """
+        Encrypt a message made of one or more 64-bit blocks using the TEA (Tiny Encryption Algorithm) cipher.
+
+        Blocks are chained according to the mode of operation, so `iv` is only needed for the first block.
+        In ECB and CTR modes the blocks are independent and, when NumPy is installed, all of them are encrypted at
+        once with vectorized 32-bit arithmetic. CBC, CFB and OFB are inherently sequential and are encrypted block by
+        block.
+
+        CFB and OFB use the standard constructions (each ciphertext block is the plaintext XORed with the encrypted
+        previous ciphertext block or keystream block). They are not interchangeable with chaining `encrypt_block`
+        calls in those modes, which additionally runs the TEA rounds over the XORed block.
+
+        :param bytes data: The plaintext to be encrypted. Its length must be a multiple of 8 bytes (64 bits).
+        :param modes.Mode mode: The cipher mode to use for encryption.
+        :param bytes iv: The initialization vector (IV) for modes that require it (e.g., CBC, CFB, OFB, CTR).
+                          Ignored for ECB. The IV must be 8 bytes (64 bits) long for modes that require it.
+
+        :returns: The ciphertext, of the same length as `data`.
+        :rtype: bytes
+
+        :raises TypeError: If the `data`, `mode`, or `iv` are not of the correct types.
+        :raises ValueError: If the length of `data` is not a multiple of 8 bytes, if the IV (when required) is not
+                            8 bytes long, or if an unsupported cipher mode is provided.
+        """
+        self._check_blocks(data, mode, iv)
+
+        if isinstance(mode, modes.ECB):
+            return self._encrypt_ecb(data)
+        if isinstance(mode, modes.CTR):
+            return self.encrypt_ctr(data, iv)
+
+        # The arguments are validated once; the per-block loops below skip the checks
+        n = self.BLOCK_BYTES
+        blocks = []
         if isinstance(mode, modes.CBC):
-            # CBC Mode: XOR the decrypted block with the IV
-            decrypted_block = bytes(a ^ b for a, b in zip(decrypted_block, iv))
-        elif isinstance(mode, (modes.CFB, modes.OFB)):
-            # CFB/OFB Mode: XOR the ciphertext block with the encrypted IV to recover plaintext
-            encrypted_iv = self.encrypt_iv(iv)
-            decrypted_block = bytes(a ^ b for a, b in zip(block, encrypted_iv))
-        elif isinstance(mode, modes.ECB):
-            pass
+            # CBC Mode: the ciphertext block is the IV of the next block
+            for i in range(0, len(data), n):
+                iv = self._encrypt_block_fast(data[i:i + n], _pre_cbc, iv)
+                blocks.append(iv)
+        elif isinstance(mode, modes.CFB):
+            # CFB Mode: XOR with the encrypted IV; the ciphertext block is the IV of the next block
+            for i in range(0, len(data), n):
+                iv = _xor8(data[i:i + n], self._encrypt_iv_raw(iv))
+                blocks.append(iv)
         else:
-            raise ValueError("Unsupported cipher mode.")
+            # OFB Mode: the keystream is the IV encrypted over and over; every IV is new, so skip the cache
+            for i in range(0, len(data), n):
+                iv = self._encrypt_iv_raw(iv)
+                blocks.append(_xor8(data[i:i + n], iv))
+        return b''.join(blocks)
+
+    def decrypt_blocks(self, data: bytes, mode: modes.Mode, iv: typing.Optional[bytes] = None) -> bytes:
+        """
+        Decrypt a message made of one or more 64-bit blocks using the TEA (Tiny Encryption Algorithm) cipher.
+
+        This is the inverse of `encrypt_blocks`. Unlike encryption, CBC and CFB decryption do not depend on previous
+        results, so in ECB, CTR, CBC and CFB modes all blocks are decrypted at once (vectorized when NumPy or the
+        native kernel is available). Only OFB is decrypted block by block.
+
+        As in `encrypt_blocks`, CFB and OFB are the standard constructions, so a message encrypted with chained
+        `encrypt_block` calls in those modes cannot be decrypted here (nor vice versa).
+
+        :param bytes data: The ciphertext to be decrypted. Its length must be a multiple of 8 bytes (64 bits).
+        :param modes.Mode mode: The cipher mode to use for decryption.
+        :param bytes iv: The initialization vector (IV) for modes that require it (e.g., CBC, CFB, OFB, CTR).
+                          Ignored for ECB. The IV must be 8 bytes (64 bits) long for modes that require it.
+
+        :returns: The plaintext, of the same length as `data`.
+        :rtype: bytes
+
+        :raises TypeError: If the `data`, `mode`, or `iv` are not of the correct types.
+        :raises ValueError: If the length of `data` is not a multiple of 8 bytes, if the IV (when required) is not
+                            8 bytes long, or if an unsupported cipher mode is provided.
+        """
+        self._check_blocks(data, mode, iv)
 
-        return decrypted_block
+        if isinstance(mode, modes.ECB):
+            return self._decrypt_ecb(data)
+        if isinstance(mode, modes.CTR):
+            return self.encrypt_ctr(data, iv)
+
+        # CBC and CFB decryption only depend on the ciphertext, so every block can be processed at once: block i is
+        # chained with ciphertext block i - 1, and the first block with the IV
+        if isinstance(mode, modes.CBC):
+            return self._decrypt_ecb(data, iv)
+        if isinstance(mode, modes.CFB):
+            return _xor_bytes(data, self._encrypt_ecb((iv + data)[:len(data)]))
+
+        # OFB Mode: the keystream depends on the previous keystream block, so it is generated sequentially
+        n = self.BLOCK_BYTES
+        blocks = []
+        for i in range(0, len(data), n):
+            iv = self._encrypt_iv_raw(iv)
+            blocks.append(_xor8(data[i:i + n], iv))
+        return b''.join(blocks)
+
+    def _check_blocks(self, data: bytes, mode: modes.Mode, iv: typing.Optional[bytes]) -> None:
+        """Validate the arguments of `encrypt_blocks` and `decrypt_blocks`."""
+        if not isinstance(data, bytes):
+            raise TypeError(f"'data' must be of type 'bytes', not of type '{type(data).__name__}'.")
+        if not isinstance(mode, modes.Mode):
+            raise TypeError(f"'mode' must be an instance of type 'Mode' (modes.Mode), not of type '{type(mode).__name__}'.")
+        if iv is not None and not isinstance(iv, bytes):
+            raise TypeError(f"'iv' must be of type 'bytes', not of type '{type(iv).__name__}'.")
+
+        if len(data) % self.BLOCK_BYTES:
+            raise ValueError(f"The data length must be a multiple of the {self.block_size}-bit ({self.BLOCK_BYTES}-byte) TEA block size.")
+        if isinstance(mode, modes.IVMode) and (not iv or len(iv) != self.BLOCK_BYTES):
+            raise ValueError(f"The IV (Initialization Vector) must be {self.block_size}-bits ({self.BLOCK_BYTES}-bytes) long for IV-based modes.")
+        if not isinstance(mode, modes.CTR):
+            _mode_handler(_MODE_PREPROC, mode)
+
+    def encrypt_ctr(self, data: bytes, nonce: bytes) -> bytes:
+        """
+        Encrypt or decrypt data in CTR (Counter) mode using the TEA (Tiny Encryption Algorithm) cipher.
+
+        The keystream is made of the encrypted counter blocks `nonce`, `nonce + 1`, `nonce + 2`, ..., where the
+        8-byte nonce is read as a big-endian 64-bit integer and the counter wraps modulo 2**64. Since the counter
+        blocks are independent, the keystream is generated in bulk like ECB. CTR is its own inverse, so the same
+        method decrypts. A nonce must never be reused with the same key.
+
+        :param bytes data: The data to be encrypted or decrypted. It may be of any length; the final partial block
+                            uses a truncated keystream block.
+        :param bytes nonce: The 64-bit initial counter block (8 bytes).
+
+        :returns: The resulting data, of the same length as `data`.
+        :rtype: bytes
+
+        :raises TypeError: If `data` or `nonce` is not of type `bytes`.
+        :raises ValueError: If the `nonce` size is not 8 bytes (64 bits).
+        """
+        if not isinstance(data, bytes):
+            raise TypeError(f"'data' must be of type 'bytes', not of type '{type(data).__name__}'.")
+        if not isinstance(nonce, bytes):
+            raise TypeError(f"'nonce' must be of type 'bytes', not of type '{type(nonce).__name__}'.")
+        if len(nonce) != self.BLOCK_BYTES:
+            raise ValueError(f"The nonce must be {self.block_size}-bits ({self.BLOCK_BYTES}-bytes) long.")
+
+        n = -(-len(data) // self.BLOCK_BYTES)
+        counter = int.from_bytes(nonce, 'big')
+        if np is not None:
+            counters = (np.uint64(counter) + np.arange(n, dtype=np.uint64)).astype('>u8').tobytes()
+        else:
+            counters = b''.join(((counter + i) & 0xffffffffffffffff).to_bytes(8, 'big') for i in range(n))
+        return _xor_bytes(data, self._encrypt_ecb(counters)[:len(data)])
+
+    def encrypt_ecb_parallel(self, data: bytes, workers: typing.Optional[int] = None) -> bytes:
+        """
+        Encrypt a message in ECB mode, splitting it across a pool of threads.
+
+        The message is cut into at most `workers` contiguous runs of whole blocks, each at least 8 KiB long, which are
+        encrypted concurrently; a message too short to split is encrypted on the calling thread. This scales with
+        the number of cores when the native C kernel is available, since it runs without holding the GIL; NumPy
+        releases the GIL for most of its work as well. The pure-Python fallback gives the same output but does not
+        run in parallel.
+
+        :param bytes data: The plaintext to be encrypted. Its length must be a multiple of 8 bytes (64 bits).
+        :param int workers: The number of threads to use. Defaults to `os.cpu_count()`.
+
+        :returns: The ciphertext, identical to `encrypt_blocks(data, modes.ECB())`.
+        :rtype: bytes
+
+        :raises TypeError: If `data` is not of type `bytes`.
+        :raises ValueError: If the length of `data` is not a multiple of 8 bytes.
+        """
+        self._check_blocks(data, modes.ECB(), None)
+        return self._ecb_parallel(self._encrypt_ecb, data, workers)
+
+    def decrypt_ecb_parallel(self, data: bytes, workers: typing.Optional[int] = None) -> bytes:
+        """
+        Decrypt a message in ECB mode, splitting it across a pool of threads.
+
+        This is the inverse of `encrypt_ecb_parallel`.
+
+        :param bytes data: The ciphertext to be decrypted. Its length must be a multiple of 8 bytes (64 bits).
+        :param int workers: The number of threads to use. Defaults to `os.cpu_count()`.
+
+        :returns: The plaintext, identical to `decrypt_blocks(data, modes.ECB())`.
+        :rtype: bytes
+
+        :raises TypeError: If `data` is not of type `bytes`.
+        :raises ValueError: If the length of `data` is not a multiple of 8 bytes.
+        """
+        self._check_blocks(data, modes.ECB(), None)
+        return self._ecb_parallel(self._decrypt_ecb, data, workers)
+
+    def _ecb_parallel(self, process: typing.Callable[[bytes], bytes], data: bytes, workers: typing.Optional[int]) -> bytes:
+        """Apply `process` to block-aligned chunks of `data` on a thread pool and join the results."""
+        workers = min(workers or os.cpu_count() or 1, len(data) // _PARALLEL_MIN_CHUNK)
+        n = len(data) // self.BLOCK_BYTES
+        if workers <= 1:
+            return process(data)
+
+        # Contiguous runs of whole blocks, one per worker
+        step = -(-n // workers) * self.BLOCK_BYTES
+        chunks = [data[i:i + step] for i in range(0, len(data), step)]
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(chunks)) as pool:
+            return b''.join(pool.map(process, chunks))
+
+    def _encrypt_ecb(self, data: bytes) -> bytes:
+        """Encrypt every 64-bit block of `data` independently."""
+        if _tea_kernels.tea_encrypt_blocks is not None:
+            return _tea_kernels.tea_encrypt_blocks(data, *self._k)
+        if np is not None and len(data) >= _NUMPY_MIN_BLOCKS * self.BLOCK_BYTES:
+            v = np.frombuffer(data, dtype='>u4').astype(np.uint32).reshape(-1, 2)
+            v0, v1 = self._encrypt_words_array(v[:, 0], v[:, 1])
+            return np.column_stack((v0, v1)).astype('>u4').tobytes()
+        # A compiled single-block kernel beats the big-integer lanes below the NumPy threshold; the pure-Python rounds
+        # do not, from two blocks on
+        if _tea_kernels.tea_encrypt is None and len(data) > self.BLOCK_BYTES:
+            return self._encrypt_ecb_swar(data)
+        return b''.join(_BLOCK.pack(*self._encrypt_words(v0, v1)) for v0, v1 in _BLOCK.iter_unpack(data))
+
+    def _decrypt_ecb(self, data: bytes, iv: typing.Optional[bytes] = None) -> bytes:
+        """
+        Decrypt every 64-bit block of `data` independently. If `iv` is given, each result is XORed with the preceding
+        ciphertext block, and the first one with `iv` (CBC).
+        """
+        if _tea_kernels.tea_decrypt_blocks is not None:
+            return _tea_kernels.tea_decrypt_blocks(data, *self._k, iv=iv)
+        if np is not None and len(data) >= _NUMPY_MIN_BLOCKS * self.BLOCK_BYTES:
+            v = np.frombuffer(data, dtype='>u4').astype(np.uint32).reshape(-1, 2)
+            v0, v1 = self._decrypt_words_array(v[:, 0], v[:, 1])
+            if iv is not None and data:
+                # Fold the chaining XOR into the decrypted halves: the preceding blocks are v shifted down one row
+                v0[1:] ^= v[:-1, 0]
+                v1[1:] ^= v[:-1, 1]
+                c0, c1 = _BLOCK.unpack(iv)
+                v0[0] ^= c0
+                v1[0] ^= c1
+            return np.column_stack((v0, v1)).astype('>u4').tobytes()
+        if _tea_kernels.tea_decrypt is None and len(data) > self.BLOCK_BYTES:
+            return self._decrypt_ecb_swar(data, iv)
+        decrypted = b''.join(_BLOCK.pack(*self._decrypt_words(v0, v1)) for v0, v1 in _BLOCK.iter_unpack(data))
+        return decrypted if iv is None or not data else _xor_bytes(decrypted, iv + data[:-self.BLOCK_BYTES])
+
+    def _encrypt_ecb_swar(self, data: bytes) -> bytes:
+        """
+        Encrypt every 64-bit block of `data` at once, packing all of them into Python integers.
+
+        Every block gets a 64-bit lane in two big integers `v0` and `v1`: its 32-bit half in the low bits and 32 zero
+        guard bits above it. Each round is then a handful of big-integer operations over all blocks, whose carries
+        and shifted-in bits land in the guard bits and are cleared by masking every lane back to 32 bits.
+        """
+        # Every constant is broadcast to all lanes by multiplying it with a 1 in each lane
+        ones = int.from_bytes(b'\0\0\0\0\0\0\0\1' * (len(data) // self.BLOCK_BYTES), 'big')
+        mask = 0xffffffff * ones
+        n = int.from_bytes(data, 'big')
+        v0 = (n >> 32) & mask
+        v1 = n & mask
+        k0, k1, k2, k3 = (k * ones for k in self._k)
+        for s in self.SUMS:
+            s *= ones
+            v0 = (v0 + (((v1 << 4) + k0) ^ (v1 + s) ^ ((v1 >> 5) + k1))) & mask
+            v1 = (v1 + (((v0 << 4) + k2) ^ (v0 + s) ^ ((v0 >> 5) + k3))) & mask
+        return ((v0 << 32) | v1).to_bytes(len(data), 'big')
+
+    def _decrypt_ecb_swar(self, data: bytes, iv: typing.Optional[bytes] = None) -> bytes:
+        """Decrypt every 64-bit block of `data` at once in Python integers, chaining them as `_decrypt_ecb` does."""
+        ones = int.from_bytes(b'\0\0\0\0\0\0\0\1' * (len(data) // self.BLOCK_BYTES), 'big')
+        mask = 0xffffffff * ones
+        # Setting bit 32 of every lane before subtracting a 32-bit value keeps borrows from crossing lanes
+        borrow = ones << 32
+        n = int.from_bytes(data, 'big')
+        v0 = (n >> 32) & mask
+        v1 = n & mask
+        k0, k1, k2, k3 = (k * ones for k in self._k)
+        for s in reversed(self.SUMS):
+            s *= ones
+            v1 = ((v1 | borrow) - ((((v0 << 4) + k2) ^ (v0 + s) ^ ((v0 >> 5) + k3)) & mask)) & mask
+            v0 = ((v0 | borrow) - ((((v1 << 4) + k0) ^ (v1 + s) ^ ((v1 >> 5) + k1)) & mask)) & mask
+        decrypted = (v0 << 32) | v1
+        if iv is not None:
+            # The preceding blocks are the ciphertext shifted down one block, with the IV shifted in at the top
+            decrypted ^= (n >> 64) | (int.from_bytes(iv, 'big') << (8 * len(data) - 64))
+        return decrypted.to_bytes(len(data), 'big')
 
     def encrypt_iv(self, iv: bytes) -> bytes:
         """
@@ -190,18 +557,85 @@ class TEA(BlockCipherAlgorithm):
 
         :raises TypeError: If `iv` is not of type `bytes`.
         :raises ValueError: If the `iv` size is not 8 bytes (64 bits).
+
+        .. note:: The 64 most recently encrypted IVs are cached for the lifetime of the cipher instance, so encrypting
+                  or decrypting several blocks one at a time with the same IV only runs the rounds once. The cached
+                  values are E_K(IV), which in OFB mode is keystream; call `clear_iv_cache` to discard them. The cache
+                  does not make IV reuse safe: CFB and OFB still require a unique IV per message.
         """
         if not isinstance(iv, bytes):
             raise TypeError(f"'iv' must be of type 'bytes', not of type '{type(iv).__name__}'.")
-        if len(iv) != self.block_size // 8:
-            raise ValueError(f"The IV (Initialization Vector) must be {self.block_size}-bits ({self.block_size // 8}-bytes) long.")
-
-        v0, v1 = struct.unpack("!2I", iv)
-        s = 0
-        for _ in range(self.ROUNDS):
-            s = (s + self.DELTA) & 0xffffffff
-            v0 += ((v1 << 4) + self.key[0] ^ (v1 + s) ^ (v1 >> 5) + self.key[1]) & 0xffffffff
-            v0 &= 0xffffffff
-            v1 += ((v0 << 4) + self.key[2] ^ (v0 + s) ^ (v0 >> 5) + self.key[3]) & 0xffffffff
-            v1 &= 0xffffffff
-        return struct.pack("!2I", v0, v1)
+        if len(iv) != self.BLOCK_BYTES:
+            raise ValueError(f"The IV (Initialization Vector) must be {self.block_size}-bits ({self.BLOCK_BYTES}-bytes) long.")
+
+        return self._enc_iv(iv)
+
+    def clear_iv_cache(self) -> None:
+        """Discard the encrypted IVs cached by `encrypt_iv` and the per-block CFB/OFB paths."""
+        self._enc_iv.cache_clear()
+
+    def _encrypt_iv_raw(self, iv: bytes) -> bytes:
+        """Encrypt an IV without validating it or going through the cache; the caller guarantees 8 bytes."""
+        return _encrypt_iv_with_keys(self._k, iv)
+
+    def _encrypt_words(self, v0: int, v1: int) -> typing.Tuple[int, int]:
+        """Run the TEA encryption rounds on the two 32-bit halves of a block."""
+        if _tea_kernels.tea_encrypt is not None:
+            return _tea_kernels.tea_encrypt(v0, v1, *self._k)
+
+        return _tea_encrypt_unrolled(v0, v1, *self._k)
+
+    def _decrypt_words(self, v0: int, v1: int) -> typing.Tuple[int, int]:
+        """Run the TEA decryption rounds on the two 32-bit halves of a block."""
+        if _tea_kernels.tea_decrypt is not None:
+            return _tea_kernels.tea_decrypt(v0, v1, *self._k)
+
+        return _tea_decrypt_unrolled(v0, v1, *self._k)
+
+    def _encrypt_words_array(self, v0: 'np.ndarray', v1: 'np.ndarray') -> typing.Tuple['np.ndarray', 'np.ndarray']:
+        """Run the TEA encryption rounds on arrays of 32-bit block halves, one block per element."""
+        k0, k1, k2, k3 = self._k
+        # uint32 arrays wrap on overflow, so no masking is needed
+        v0 = v0.copy()
+        v1 = v1.copy()
+        for s in self.SUMS:
+            v0 += ((v1 << 4) + k0) ^ (v1 + s) ^ ((v1 >> 5) + k1)
+            v1 += ((v0 << 4) + k2) ^ (v0 + s) ^ ((v0 >> 5) + k3)
+        return v0, v1
+
+    def _decrypt_words_array(self, v0: 'np.ndarray', v1: 'np.ndarray') -> typing.Tuple['np.ndarray', 'np.ndarray']:
+        """Run the TEA decryption rounds on arrays of 32-bit block halves, one block per element."""
+        k0, k1, k2, k3 = self._k
+        v0 = v0.copy()
+        v1 = v1.copy()
+        for s in reversed(self.SUMS):
+            v1 -= ((v0 << 4) + k2) ^ (v0 + s) ^ ((v0 >> 5) + k3)
+            v0 -= ((v1 << 4) + k0) ^ (v1 + s) ^ ((v1 >> 5) + k1)
+        return v0, v1
+
+
+def _generate_rounds(name: str, sums: typing.Sequence[int], decrypt: bool) -> typing.Callable[..., typing.Tuple[int, int]]:
+    """
+    Generate a pure-Python TEA round function `name(v0, v1, k0, k1, k2, k3)` specialized for a fixed schedule.
+
+    Every round is written out as straight-line code with its sum inlined as a literal, so the generated function has
+    no loop, no loop-carried sum and no per-round lookups.
+    """
+    lines = [f"def {name}(v0, v1, k0, k1, k2, k3):"]
+    for s in (reversed(sums) if decrypt else sums):
+        if decrypt:
+            lines.append(f"    v1 = (v1 - (((v0 << 4) + k2) ^ (v0 + {s:#010x}) ^ ((v0 >> 5) + k3))) & 0xffffffff")
+            lines.append(f"    v0 = (v0 - (((v1 << 4) + k0) ^ (v1 + {s:#010x}) ^ ((v1 >> 5) + k1))) & 0xffffffff")
+        else:
+            lines.append(f"    v0 = (v0 + (((v1 << 4) + k0) ^ (v1 + {s:#010x}) ^ ((v1 >> 5) + k1))) & 0xffffffff")
+            lines.append(f"    v1 = (v1 + (((v0 << 4) + k2) ^ (v0 + {s:#010x}) ^ ((v0 >> 5) + k3))) & 0xffffffff")
+    lines.append("    return v0, v1")
+
+    namespace = {}
+    exec(compile("\n".join(lines), f"<{name}>", "exec"), namespace)
+    return namespace[name]
+
+
+# The fallback rounds used by TEA._encrypt_words/_decrypt_words when no compiled kernel is available
+_tea_encrypt_unrolled = _generate_rounds('_tea_encrypt_unrolled', TEA.SUMS, decrypt=False)
+_tea_decrypt_unrolled = _generate_rounds('_tea_decrypt_unrolled', TEA.SUMS, decrypt=True)
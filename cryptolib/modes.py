@@ -1,24 +1,21 @@
-from abc import ABC
-
-
-# Abstract base class for all cipher modes
-class Mode(ABC):
+# Base class for all cipher modes (a plain class: ABCMeta makes isinstance checks against it several times slower)
+class Mode:
     """
     A marker class for cipher modes.
 
     This class is used to identify cipher modes without enforcing any methods.
     """
-    pass
+    __slots__ = ()
 
 
-# Abstract base class for cipher modes that require an IV (Initialization Vector)
+# Base class for cipher modes that require an IV (Initialization Vector)
 class IVMode(Mode):
     """
     A marker class for cipher modes that require an IV (Initialization Vector).
 
     Inherits from Mode to identify IV modes.
     """
-    pass
+    __slots__ = ()
 
 
 # Core modes
@@ -28,7 +25,7 @@ class CBC(IVMode):
 
     Requires an IV for encryption and decryption.
     """
-    pass
+    __slots__ = ()
 
 
 class CFB(IVMode):
@@ -37,7 +34,7 @@ class CFB(IVMode):
 
     Requires an IV for encryption and decryption.
     """
-    pass
+    __slots__ = ()
 
 
 class OFB(IVMode):
@@ -46,7 +43,16 @@ class OFB(IVMode):
 
     Requires an IV for encryption and decryption.
     """
-    pass
+    __slots__ = ()
+
+
+class CTR(IVMode):
+    """
+    CTR mode of operation. Generates a keystream by encrypting successive values of a counter, starting from the IV (nonce), and XOR-ing it with the plaintext. Each block is independent of the others.
+
+    Requires an IV for encryption and decryption.
+    """
+    __slots__ = ()
 
 
 class ECB(Mode):
@@ -55,4 +61,4 @@ class ECB(Mode):
 
     Does not require an IV.
     """
-    pass
+    __slots__ = ()